@@ -13,19 +13,47 @@
 
 import sys
 import os
+import platform
 import shutil
+import queue
 import threading
 import time
 import math
+import http.client
+import urllib.parse
 import urllib.request
 import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# On ARM boards (e.g. Raspberry Pi) SDL2's alpha blitter is faster than pygame's; must be set before import.
+if platform.machine().lower().startswith(("arm", "aarch64")):
+    os.environ.setdefault("PYGAME_BLEND_ALPHA_SDL2", "1")
+
 import pygame
 import chess
 import chess.engine
 import chess.pgn
 
+try:
+    import psutil  # optional: lets us size the engine hash table to available RAM
+except ImportError:
+    psutil = None
+
+try:
+    import cython_chess  # optional: compiled drop-in for python-chess legal move generation
+except ImportError:
+    cython_chess = None
+else:
+    _py_generate_legal_moves = chess.Board.generate_legal_moves
+    def _generate_legal_moves(self, from_mask=chess.BB_ALL, to_mask=chess.BB_ALL):
+        # cython-chess mishandles masks when in check; python-chess masks for SAN / parse_san
+        if from_mask == chess.BB_ALL and to_mask == chess.BB_ALL:
+            return cython_chess.generate_legal_moves(self, from_mask, to_mask)
+        return _py_generate_legal_moves(self, from_mask, to_mask)
+    chess.Board.generate_legal_moves = _generate_legal_moves
+
 # ---------- APP METADATA ----------
 APP_NAME = "GrandMaster Guide"
 FOOTER_TEXT = "Created by Milad pezeshkian  All right reserverd"
@@ -36,13 +64,18 @@ BOARD_SIZE = SQ_SIZE * 8
 PANEL_WIDTH = 340
 WINDOW_SIZE = (BOARD_SIZE + PANEL_WIDTH, BOARD_SIZE)
 FPS = 60
+IDLE_WAIT_MS = 250  # max sleep between loop passes when nothing animates
 
 PIECE_URL = "https://chessboardjs.com/img/chesspieces/wikipedia/{}.png"
+DOWNLOAD_WORKERS = 4  # parallel keep-alive connections for piece downloads
 
 DEFAULT_MOVETIME = 2.0
 MIN_MOVETIME = 0.5
 MAX_MOVETIME = 30.0
 HASH_MB = 256
+HASH_MB_LARGE = 1024          # used when psutil reports enough free memory
+HASH_LARGE_MIN_FREE_MB = 4096
+MOVE_OVERHEAD_MS = 10         # GUI and engine share the machine; little latency to cover
 
 # Colors
 LIGHT_COLOR = (240, 217, 181)
@@ -58,6 +91,9 @@ TEXT_COLOR = (230, 230, 230)
 NOTE_COLOR = (190,190,190)
 ERR_COLOR = (220, 80, 80)
 
+# Piece sprites are stored premultiplied when this pygame supports it
+PIECE_BLEND = pygame.BLEND_PREMULTIPLIED if hasattr(pygame.Surface, "premul_alpha") else 0
+
 # ---------- resource helpers ----------
 def resource_path(relpath: str) -> str:
     """ Resolve a local resource path in dev and after PyInstaller freeze. """
@@ -90,6 +126,16 @@ def find_stockfish() -> str:
         return which
     return None
 
+def engine_hash_mb() -> int:
+    """ Engine hash size in MB: larger when psutil is installed and RAM allows it. """
+    if psutil is None:
+        return HASH_MB
+    try:
+        free_mb = psutil.virtual_memory().available // (1024 * 1024)
+    except Exception:
+        return HASH_MB
+    return HASH_MB_LARGE if free_mb >= HASH_LARGE_MIN_FREE_MB else HASH_MB
+
 # ---------- image helpers ----------
 def download_piece_images_if_missing(dest_folder="pieces"):
     """ Download piece images only in development mode. If frozen, use bundled pieces. """
@@ -99,15 +145,50 @@ def download_piece_images_if_missing(dest_folder="pieces"):
 
     os.makedirs(dest_folder, exist_ok=True)
     names = ["wK","wQ","wR","wB","wN","wP","bK","bQ","bR","bB","bN","bP"]
-    ok = True
+    missing = []
     for n in names:
         path = os.path.join(dest_folder, f"{n}.png")
         if not os.path.exists(path) or os.path.getsize(path) < 200:
+            missing.append(n)
+    if not missing:
+        return dest_folder
+    # each worker fetches its share over one reused connection
+    chunks = [missing[i::DOWNLOAD_WORKERS] for i in range(min(DOWNLOAD_WORKERS, len(missing)))]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as ex:
+        ok = all(list(ex.map(lambda chunk: _download_pieces(chunk, dest_folder), chunks)))
+    return dest_folder if ok else None
+
+def _download_pieces(names, dest_folder):
+    """ Download piece PNGs over a single keep-alive HTTPS connection. Returns True if all succeeded. """
+    parts = urllib.parse.urlsplit(PIECE_URL)
+    # http.client ignores proxy settings; behind a proxy go through urllib only
+    direct = parts.scheme not in urllib.request.getproxies()
+    conn = http.client.HTTPSConnection(parts.netloc, timeout=10) if direct else None
+    ok = True
+    try:
+        for n in names:
+            url = PIECE_URL.format(n)
+            path = os.path.join(dest_folder, f"{n}.png")
+            if conn is not None:
+                try:
+                    conn.request("GET", urllib.parse.urlsplit(url).path)
+                    resp = conn.getresponse()
+                    data = resp.read()
+                    if resp.status == 200:
+                        with open(path, "wb") as f:
+                            f.write(data)
+                        continue
+                except Exception:
+                    conn.close()  # http.client reopens on the next request
+            # proxy, redirect, odd response or connection error: let urllib deal with this one
             try:
-                urllib.request.urlretrieve(PIECE_URL.format(n), path)
+                urllib.request.urlretrieve(url, path)
             except Exception:
                 ok = False
-    return dest_folder if ok else None
+    finally:
+        if conn is not None:
+            conn.close()
+    return ok
 
 def load_piece_surfaces(folder):
     if not folder:
@@ -117,7 +198,7 @@ def load_piece_surfaces(folder):
     if not os.path.isdir(folder):
         return None
     try:
-        mapping = {}
+        keys = []; paths = []
         for fname in os.listdir(folder):
             if not fname.lower().endswith(".png"):
                 continue
@@ -125,9 +206,19 @@ def load_piece_surfaces(folder):
             if len(name) != 2:
                 continue
             color = name[0].lower(); piece = name[1]
-            key = piece.upper() if color == 'w' else piece.lower()
-            surf = pygame.image.load(os.path.join(folder, fname)).convert_alpha()
-            surf = pygame.transform.smoothscale(surf, (SQ_SIZE, SQ_SIZE))
+            keys.append(piece.upper() if color == 'w' else piece.lower())
+            paths.append(os.path.join(folder, fname))
+        # file IO + PNG decode in worker threads (pygame releases the GIL while loading);
+        # display-format conversion and scaling stay on the main thread
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+            decoded = list(ex.map(pygame.image.load, paths))
+        mapping = {}
+        for key, surf in zip(keys, decoded):
+            surf = surf.convert_alpha()
+            # smoothscale may hand back a different pixel format; convert again to match the display
+            surf = pygame.transform.smoothscale(surf, (SQ_SIZE, SQ_SIZE)).convert_alpha()
+            if PIECE_BLEND:
+                surf = surf.premul_alpha()
             mapping[key] = surf
         needed = set(["K","Q","R","B","N","P","k","q","r","b","n","p"])
         if not needed.issubset(set(mapping.keys())):
@@ -137,6 +228,27 @@ def load_piece_surfaces(folder):
         return None
 
 # ---------- drawing helpers ----------
+# suggestion pulse 0.6 + 0.4*sin(5t), sampled over one period
+PULSE_STEPS = 60
+_PULSE = [0.6 + 0.4 * math.sin(i * 2 * math.pi / PULSE_STEPS) for i in range(PULSE_STEPS)]
+_PULSE_RATE = 5.0 * PULSE_STEPS / (2 * math.pi)  # LUT steps per second
+
+TEXT_CACHE_SIZE = 128
+_text_cache = OrderedDict()
+
+def render_text(font, text, color):
+    """ font.render with a small LRU cache keyed by (font, text, color). """
+    key = (id(font), text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = font.render(text, True, color)
+        _text_cache[key] = surf
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surf
+
 def square_to_pixel(sq, orientation_white_bottom):
     f = chess.square_file(sq); r = chess.square_rank(sq)
     if orientation_white_bottom:
@@ -155,6 +267,50 @@ def pixel_to_square(mx, my, orientation_white_bottom):
         file = int(7 - file_px); rank = int(rank_px)
     return chess.square(file, rank)
 
+def square_overlay(rgba):
+    """ A square-sized translucent fill, converted once to the display's alpha format. """
+    surf = pygame.Surface((SQ_SIZE, SQ_SIZE), pygame.SRCALPHA)
+    surf.fill(rgba)
+    return surf.convert_alpha()
+
+def square_border(color, width):
+    """ Square-sized transparent sprite with an opaque border of the given width. """
+    surf = pygame.Surface((SQ_SIZE, SQ_SIZE), pygame.SRCALPHA)
+    pygame.draw.rect(surf, color, surf.get_rect(), width)
+    return surf.convert_alpha()
+
+def dot_sprite(color, radius):
+    """ Filled circle sprite; blit it at (center - radius) to match draw.circle(center, radius). """
+    surf = pygame.Surface((2*radius + 1, 2*radius + 1), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (radius, radius), radius)
+    return surf.convert_alpha()
+
+def render_simple_piece(piece):
+    """ Fallback sprite (filled circle with outline) used when piece PNGs are unavailable. """
+    surf = pygame.Surface((SQ_SIZE, SQ_SIZE), pygame.SRCALPHA)
+    fill = (245,245,245) if piece.color == chess.WHITE else (25,25,25)
+    outline = (20,20,20) if piece.color == chess.WHITE else (245,245,245)
+    cx = SQ_SIZE//2; cy = SQ_SIZE//2
+    if piece.piece_type == chess.PAWN:
+        pygame.draw.circle(surf, fill, (cx, cy - 8), SQ_SIZE//7)
+        pygame.draw.circle(surf, outline, (cx, cy - 8), SQ_SIZE//7, 2)
+    else:
+        pygame.draw.circle(surf, fill, (cx, cy - 6), SQ_SIZE//6)
+        pygame.draw.circle(surf, outline, (cx, cy - 6), SQ_SIZE//6, 2)
+    surf = surf.convert_alpha()
+    if PIECE_BLEND:
+        surf = surf.premul_alpha()
+    return surf
+
+def blit_many(surface, seq, special_flags=0):
+    """ Blit a list of (source, dest) pairs in a single call; fblits needs pygame-ce. """
+    if hasattr(surface, "fblits"):
+        surface.fblits(seq, special_flags)
+    elif special_flags:
+        surface.blits([(src, dest, None, special_flags) for src, dest in seq], doreturn=False)
+    else:
+        surface.blits(seq, doreturn=False)
+
 def draw_arrow(surface, start, end, color=SUGGEST_COLOR, width=4):
     pygame.draw.line(surface, color, start, end, width)
     sx, sy = start; ex, ey = end
@@ -164,6 +320,11 @@ def draw_arrow(surface, start, end, color=SUGGEST_COLOR, width=4):
     right = (ex - head * math.cos(angle + math.pi/6), ey - head * math.sin(angle + math.pi/6))
     pygame.draw.polygon(surface, color, [end, left, right])
 
+def coalesce_motion(events):
+    """ Drop MOUSEMOTION events immediately followed by another one; positions are absolute. """
+    return [ev for i, ev in enumerate(events)
+            if not (ev.type == pygame.MOUSEMOTION and i + 1 < len(events) and events[i + 1].type == pygame.MOUSEMOTION)]
+
 # ---------- UI widgets ----------
 class Button:
     def __init__(self, x, y, w, h, label, font, action=None):
@@ -172,12 +333,17 @@ class Button:
         self.font = font
         self.action = action
         self.hover = False
-    def draw(self, surf):
-        color = BTN_HOVER if self.hover else BTN_BG
-        pygame.draw.rect(surf, color, self.rect, border_radius=8)
-        pygame.draw.rect(surf, (0,0,0), self.rect, 2, border_radius=8)
-        txt = self.font.render(self.label, True, TEXT_COLOR)
-        surf.blit(txt, (self.rect.x + (self.rect.w - txt.get_width())//2, self.rect.y + (self.rect.h - txt.get_height())//2))
+    def draw(self, surf, origin=(0, 0), hover=None):
+        # origin: top-left of surf in window coordinates (for off-screen surfaces)
+        # hover: override self.hover (None = use current state)
+        rect = self.rect.move(-origin[0], -origin[1])
+        if hover is None:
+            hover = self.hover
+        color = BTN_HOVER if hover else BTN_BG
+        pygame.draw.rect(surf, color, rect, border_radius=8)
+        pygame.draw.rect(surf, (0,0,0), rect, 2, border_radius=8)
+        txt = render_text(self.font, self.label, TEXT_COLOR)
+        surf.blit(txt, (rect.x + (rect.w - txt.get_width())//2, rect.y + (rect.h - txt.get_height())//2))
     def contains(self, pos):
         return self.rect.collidepoint(pos)
 
@@ -206,6 +372,11 @@ class Slider:
         t = (mx - self.rect.x) / float(max(1, self.rect.w))
         t = max(0.0, min(1.0, t))
         self.value = self.minv + t*(self.maxv - self.minv)
+    def bounds(self):
+        """ Screen area touched by draw(): track, handle and value label above it. """
+        r = self.handle_radius
+        top = self.rect.y - self.font.get_linesize() - 6
+        return pygame.Rect(self.rect.x - r, top, self.rect.w + 2*r, self.rect.bottom + r - top)
     def handle_pos(self):
         t = (self.value - self.minv) / float(self.maxv - self.minv)
         x = int(self.rect.x + t*self.rect.w); y = int(self.rect.y + self.rect.h//2)
@@ -217,7 +388,7 @@ class Slider:
         pygame.draw.rect(surf, fill, filled, border_radius=6)
         pygame.draw.circle(surf, handle, (hx, hy), self.handle_radius)
         pygame.draw.circle(surf, (40,40,40), (hx, hy), self.handle_radius, 2)
-        val_txt = self.font.render(f"{self.value:.1f}s", True, TEXT_COLOR)
+        val_txt = render_text(self.font, f"{self.value:.1f}s", TEXT_COLOR)
         surf.blit(val_txt, (self.rect.x + (self.rect.w - val_txt.get_width())//2, self.rect.y - val_txt.get_height() - 6))
 
 # ---------- App ----------
@@ -227,6 +398,10 @@ class ChessApp:
         self.screen = pygame.display.set_mode(WINDOW_SIZE)
         pygame.display.set_caption(APP_NAME)
         self.clock = pygame.time.Clock()
+        # only queue events the loop handles; expose events force a full redraw
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                  pygame.MOUSEMOTION, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE])
 
         # fonts
         self.font_big = pygame.font.SysFont("dejavusans", 20, bold=True)
@@ -239,15 +414,20 @@ class ChessApp:
         self.selected = None
         self.last_move = None
         self.redo_stack = []
+        # legal moves from the selected square, regenerated only when position or selection change
+        self._legal_cache_key = None
+        self._legal_cache = []
 
         # engine
         self.engine_path = engine_path
         self.engine = None
         self._start_engine()
         self.engine_thread = None
+        # engine thread hands finished jobs to the main loop; it never touches GUI state
+        self.engine_results = queue.Queue()
         self.engine_thinking = False
         self.engine_start = None
-        self.cancel_request = False
+        self.cancel_request = threading.Event()
         self.last_think_duration = 0.0
 
         # suggestion (internal only)
@@ -261,6 +441,13 @@ class ChessApp:
 
         # orientation
         self.orientation_white_bottom = True
+        # square -> top-left pixel, per orientation (static)
+        self._sq2xy = {white_bottom: [square_to_pixel(sq, white_bottom) for sq in chess.SQUARES]
+                       for white_bottom in (True, False)}
+        # (column, row) on screen -> square, per orientation, indexed by column*8 + row
+        self._xy2sq = {white_bottom: [pixel_to_square(col*SQ_SIZE, row*SQ_SIZE, white_bottom)
+                                      for col in range(8) for row in range(8)]
+                       for white_bottom in (True, False)}
 
         # layout: minimal right panel
         self.panel_x = BOARD_SIZE
@@ -283,6 +470,9 @@ class ChessApp:
         self.progress_rect = pygame.Rect(self.panel_x + self.margin, y-20, self.inner_w, 10)
         # text offset below progress (to avoid overlap)
         self.think_text_offset = 12
+        # progress bar plus the think-time line under it (redrawn while thinking)
+        self.progress_area = pygame.Rect(self.progress_rect.x, self.progress_rect.y, self.inner_w,
+                                         self.progress_rect.h + self.think_text_offset + self.font_small.get_linesize())
         y += 12 + 12  # progress height + spacing
 
         # buttons stack: user requested; move them 5 pixels down (tiny nudge)
@@ -315,13 +505,55 @@ class ChessApp:
             self.btn_undo, self.btn_redo, self.btn_toggle_persp
         ]
 
+        # static panel chrome (rebuilt only when a button label changes)
+        self.panel_static = None
+        self._build_panel_static()
+
         # load piece images if possible
         folder = resource_path("pieces") if getattr(sys, "frozen", False) else download_piece_images_if_missing("pieces")
         self.pieces = load_piece_surfaces(folder)
         self.use_images = bool(self.pieces)
+        if not self.use_images:
+            # no PNGs: pre-render simple sprites so drawing takes the same blit path
+            self.pieces = {symbol: render_simple_piece(chess.Piece.from_symbol(symbol)) for symbol in "KQRBNPkqrbnp"}
+
+        # static checkerboard, rendered once and blitted each frame
+        self.board_bg = pygame.Surface((BOARD_SIZE, BOARD_SIZE)).convert()
+        for r in range(8):
+            for f in range(8):
+                c = LIGHT_COLOR if (r + f) % 2 == 0 else DARK_COLOR
+                pygame.draw.rect(self.board_bg, c, pygame.Rect(f*SQ_SIZE, r*SQ_SIZE, SQ_SIZE, SQ_SIZE))
+        # translucent square overlays reused every frame, in the display's alpha format
+        self.lastmove_overlay = square_overlay(LASTMOVE_COLOR)
+        self.suggest_overlay = square_overlay((SUGGEST_COLOR[0], SUGGEST_COLOR[1], SUGGEST_COLOR[2], 100))
+        # indicator sprites: suggestion border per pulse width, selection border, legal-move dot
+        self.suggest_borders = {w: square_border(SUGGEST_COLOR, w) for w in range(3, 6)}
+        self.select_border = square_border(HIGHLIGHT_COLOR, 4)
+        self.legal_dot_radius = max(4, SQ_SIZE//12)
+        self.legal_dot = dot_sprite((20,200,80), self.legal_dot_radius)
+
+        # partial display updates: rects changed since the last frame, or a full flip
+        self.dirty = []
+        self.full_redraw = True
 
         self.running = True
 
+    def _xy(self, sq):
+        return self._sq2xy[self.orientation_white_bottom][sq]
+
+    def _square_at(self, pos):
+        mx, my = pos
+        if mx < 0 or my < 0 or mx >= BOARD_SIZE or my >= BOARD_SIZE:
+            return None
+        return self._xy2sq[self.orientation_white_bottom][(mx // SQ_SIZE) * 8 + my // SQ_SIZE]
+
+    def mark_dirty(self, rect=None):
+        """ Queue a screen rect for the next display update; None means the whole window. """
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty.append(rect)
+
     def _start_engine(self):
         try:
             if not self.engine_path:
@@ -337,13 +569,41 @@ class ChessApp:
 
             try:
                 threads = max(1, (os.cpu_count() or 2) - 1)
-                self.engine.configure({"Threads": threads, "Hash": HASH_MB})
+                opts = {"Threads": threads, "Hash": engine_hash_mb(), "Move Overhead": MOVE_OVERHEAD_MS}
+                # Ponder / MultiPV / UCI_AnalyseMode are managed by python-chess per play() call
+                self.engine.configure({k: v for k, v in opts.items() if k in self.engine.options})
+                # warm up: wait until the engine has applied options and is idle
+                self.engine.ping()
             except Exception:
                 pass
         except Exception:
             # if engine failed to start, set to None but keep GUI functional
             self.engine = None
 
+    def _build_panel_static(self):
+        """ Render panel background, title, footer, progress track and idle buttons once. """
+        origin = (self.panel_x, 0)
+        surf = pygame.Surface((PANEL_WIDTH, BOARD_SIZE)).convert()
+        surf.fill(PANEL_BG)
+        title = self.font_big.render("Menu", True, TEXT_COLOR)
+        surf.blit(title, (self.title_pos[0] - origin[0], self.title_pos[1]))
+        pygame.draw.rect(surf, BOX_BG, self.progress_rect.move(-origin[0], 0), border_radius=6)
+        for b in self.buttons:
+            b.draw(surf, origin, hover=False)
+        # footer (small centered line at bottom of panel)
+        footer_pad = 12
+        footer_y = BOARD_SIZE - footer_pad - 18
+        footer_surf = self.font_footer.render(FOOTER_TEXT, True, NOTE_COLOR)
+        surf.blit(footer_surf, ((PANEL_WIDTH - footer_surf.get_width()) // 2, footer_y))
+        self.panel_static = surf
+
+    def _legal_from_selected(self):
+        key = (len(self.board.move_stack), self.selected)
+        if key != self._legal_cache_key:
+            self._legal_cache = [m for m in self.board.legal_moves if m.from_square == self.selected]
+            self._legal_cache_key = key
+        return self._legal_cache
+
     # notifications
     def notify(self, text, color=NOTE_COLOR, ttl=3.0):
         self.notification = (text, color, time.time() + ttl)
@@ -356,7 +616,7 @@ class ChessApp:
         r = pygame.Rect(x, y, width, 36)
         pygame.draw.rect(surf, BOX_BG, r, border_radius=8)
         pygame.draw.rect(surf, (0,0,0), r, 2, border_radius=8)
-        tt = self.font_small.render(txt, True, color)
+        tt = render_text(self.font_small, txt, color)
         surf.blit(tt, (r.x + 8, r.y + (r.h - tt.get_height())//2))
 
     # perspective toggle
@@ -368,6 +628,7 @@ class ChessApp:
         else:
             self.btn_toggle_persp.label = "View: Black"
             self.notify("View: Black bottom", ttl=1.0)
+        self._build_panel_static()
 
     # suggestion workflow (engine computes moves; panel does not show SAN/score)
     def request_suggestion_for(self, for_color, override_time=None):
@@ -380,47 +641,59 @@ class ChessApp:
         if self.engine_thinking:
             self.notify("Engine already thinking", ttl=2.0); return
         self.suggestion_move = None; self.suggestion_san = None; self.suggestion_from_to = None; self.suggestion_score = None
-        self.cancel_request = False
+        self.cancel_request.clear()
         tlimit = override_time if override_time is not None else self.movetime
+        self.engine_thinking = True
+        self.engine_start = time.time()
         self.engine_thread = threading.Thread(target=self._engine_worker_suggest, args=(for_color, tlimit), daemon=True)
         self.engine_thread.start()
 
     def _engine_worker_suggest(self, for_color, tlimit):
+        """ Engine thread: search the live board (read-only here; SAN is done on the main thread). """
+        result = {"move": None, "score": None, "error": False}
+        start = time.time()
         try:
-            self.engine_thinking = True
-            self.engine_start = time.time()
-            board_copy = self.board.copy()
-            board_copy.turn = for_color
             limit = chess.engine.Limit(time=tlimit)
-            res = self.engine.play(board_copy, limit)
-            elapsed = time.time() - self.engine_start
-            self.last_think_duration = elapsed
-            if self.cancel_request:
-                self.engine_thinking = False
-                return
+            res = self.engine.play(self.board, limit, info=chess.engine.INFO_SCORE)
             if res and res.move:
-                self.suggestion_move = res.move
-                try:
-                    self.suggestion_san = board_copy.san(res.move)
-                except Exception:
-                    self.suggestion_san = str(res.move)
-                self.suggestion_from_to = (res.move.from_square, res.move.to_square)
-                try:
-                    info = self.engine.analyse(board_copy, chess.engine.Limit(depth=1))
-                    if "score" in info:
-                        sc = info["score"]
-                        if sc.is_mate():
-                            self.suggestion_score = f"# {sc.mate()}"
-                        else:
-                            self.suggestion_score = str(sc.pov(for_color).score())
-                except Exception:
-                    self.suggestion_score = None
-            else:
-                self.suggestion_move = None
+                result["move"] = res.move
+                # score comes back with the search itself; no second engine round-trip
+                sc = res.info.get("score")
+                if sc is not None:
+                    sc = sc.pov(for_color)
+                    result["score"] = f"# {sc.mate()}" if sc.is_mate() else str(sc.score())
         except Exception:
-            self.notify("Engine error", color=ERR_COLOR, ttl=3.0)
-        finally:
-            self.engine_thinking = False
+            result["error"] = True
+        result["elapsed"] = time.time() - start
+        self.engine_results.put(result)
+
+    def _poll_engine_results(self):
+        """ Main thread: apply any finished engine jobs. """
+        while True:
+            try:
+                result = self.engine_results.get_nowait()
+            except queue.Empty:
+                break
+            self._apply_engine_result(result)
+
+    def _apply_engine_result(self, result):
+        self.engine_thinking = False
+        self.last_think_duration = result["elapsed"]
+        self.mark_dirty()
+        if result["error"]:
+            self.notify("Engine error", color=ERR_COLOR, ttl=3.0); return
+        if self.cancel_request.is_set():
+            return
+        mv = result["move"]
+        self.suggestion_move = mv
+        if mv:
+            # board.san() pushes and pops internally, so it must run on the main thread
+            try:
+                self.suggestion_san = self.board.san(mv)
+            except Exception:
+                self.suggestion_san = str(mv)
+            self.suggestion_score = result["score"]
+            self.suggestion_from_to = (mv.from_square, mv.to_square)
 
     def apply_suggestion(self):
         if not self.suggestion_move:
@@ -429,13 +702,14 @@ class ChessApp:
             self.notify("Suggestion not legal now", color=ERR_COLOR, ttl=3.0); return
         self.redo_stack.clear()
         self.board.push(self.suggestion_move)
+        self._legal_cache_key = None
         self.last_move = (self.suggestion_move.from_square, self.suggestion_move.to_square)
         self.notify("Suggestion applied", ttl=1.6)
 
     def cancel_thinking(self):
         if not self.engine_thinking:
             self.notify("No active thinking job", ttl=1.2); return
-        self.cancel_request = True
+        self.cancel_request.set()
         self.notify("Cancel requested", ttl=1.6)
 
     # undo / redo
@@ -447,6 +721,7 @@ class ChessApp:
                 break
             mv = self.board.pop()
             self.redo_stack.append(mv)
+        self._legal_cache_key = None
         self.suggestion_move = None; self.suggestion_san = None; self.suggestion_from_to = None; self.suggestion_score = None
         if self.board.move_stack:
             last = self.board.move_stack[-1]; self.last_move = (last.from_square, last.to_square)
@@ -461,12 +736,13 @@ class ChessApp:
         mv = self.redo_stack.pop()
         if mv in self.board.legal_moves:
             self.board.push(mv); self.last_move = (mv.from_square, mv.to_square)
+            self._legal_cache_key = None
         else:
             self.notify("Redo not legal now", color=ERR_COLOR, ttl=2.8)
 
     # board interaction (two-click move)
     def handle_board_click(self, pos):
-        sq = pixel_to_square(pos[0], pos[1], self.orientation_white_bottom)
+        sq = self._square_at(pos)
         if sq is None:
             return
         piece = self.board.piece_at(sq)
@@ -480,9 +756,14 @@ class ChessApp:
                 tr = chess.square_rank(mv.to_square)
                 if (p.color == chess.WHITE and tr == 7) or (p.color == chess.BLACK and tr == 0):
                     mv = chess.Move(mv.from_square, mv.to_square, promotion=chess.QUEEN)
-            if mv in self.board.legal_moves:
+            legal = mv in self.board.legal_moves
+            if legal and self.engine_thinking:
+                # the engine thread is searching this board; selection still updates below
+                self.notify("Cannot move while engine thinking", color=ERR_COLOR, ttl=3.0)
+            elif legal:
                 self.redo_stack.clear()
                 self.board.push(mv)
+                self._legal_cache_key = None
                 self.last_move = (mv.from_square, mv.to_square)
                 self.suggestion_move = None; self.suggestion_san = None; self.suggestion_from_to = None; self.suggestion_score = None
             else:
@@ -498,65 +779,40 @@ class ChessApp:
 
     # drawing
     def draw_board(self):
-        for r in range(8):
-            for f in range(8):
-                c = LIGHT_COLOR if (r + f) % 2 == 0 else DARK_COLOR
-                pygame.draw.rect(self.screen, c, pygame.Rect(f*SQ_SIZE, r*SQ_SIZE, SQ_SIZE, SQ_SIZE))
+        self.screen.blit(self.board_bg, (0, 0))
+        # indicators are pre-rendered sprites, batched below and above the suggestion arrow
+        under = []; over = []
         if self.last_move:
             for sq in self.last_move:
-                x, y = square_to_pixel(sq, self.orientation_white_bottom)
-                surf = pygame.Surface((SQ_SIZE, SQ_SIZE), pygame.SRCALPHA)
-                surf.fill(LASTMOVE_COLOR)
-                self.screen.blit(surf, (x, y))
+                under.append((self.lastmove_overlay, self._xy(sq)))
         if self.suggestion_from_to:
             fr, to = self.suggestion_from_to
-            sx, sy = square_to_pixel(fr, self.orientation_white_bottom)
-            tx, ty = square_to_pixel(to, self.orientation_white_bottom)
-            t = time.time(); pulse = 0.6 + 0.4 * math.sin(t * 5.0)
-            pygame.draw.rect(self.screen, SUGGEST_COLOR, pygame.Rect(sx, sy, SQ_SIZE, SQ_SIZE), 3 + int(2*pulse))
-            overlay = pygame.Surface((SQ_SIZE, SQ_SIZE), pygame.SRCALPHA)
-            overlay.fill((SUGGEST_COLOR[0], SUGGEST_COLOR[1], SUGGEST_COLOR[2], 100))
-            self.screen.blit(overlay, (tx, ty))
+            sx, sy = self._xy(fr)
+            tx, ty = self._xy(to)
+            pulse = _PULSE[int(time.time() * _PULSE_RATE) % PULSE_STEPS]
+            under.append((self.suggest_borders[3 + int(2*pulse)], (sx, sy)))
+            under.append((self.suggest_overlay, (tx, ty)))
+        if under:
+            blit_many(self.screen, under)
+        if self.suggestion_from_to:
             draw_arrow(self.screen, (sx + SQ_SIZE//2, sy + SQ_SIZE//2), (tx + SQ_SIZE//2, ty + SQ_SIZE//2), SUGGEST_COLOR, 3)
         if self.selected is not None:
-            sx, sy = square_to_pixel(self.selected, self.orientation_white_bottom)
-            pygame.draw.rect(self.screen, HIGHLIGHT_COLOR, pygame.Rect(sx, sy, SQ_SIZE, SQ_SIZE), 4)
-            for mv in self.board.legal_moves:
-                if mv.from_square == self.selected:
-                    dx, dy = square_to_pixel(mv.to_square, self.orientation_white_bottom)
-                    pygame.draw.circle(self.screen, (20,200,80), (dx + SQ_SIZE//2, dy + SQ_SIZE//2), max(4, SQ_SIZE//12))
-        for sq in chess.SQUARES:
-            p = self.board.piece_at(sq)
-            if not p: continue
-            x, y = square_to_pixel(sq, self.orientation_white_bottom)
-            if self.use_images and p.symbol() in self.pieces:
-                self.screen.blit(self.pieces[p.symbol()], (x, y))
-            else:
-                self._draw_simple_piece(x, y, p)
-
-    def _draw_simple_piece(self, x, y, piece):
-        rect = pygame.Rect(x, y, SQ_SIZE, SQ_SIZE)
-        fill = (245,245,245) if piece.color == chess.WHITE else (25,25,25)
-        outline = (20,20,20) if piece.color == chess.WHITE else (245,245,245)
-        cx = rect.x + rect.w//2; cy = rect.y + rect.h//2
-        if piece.piece_type == chess.PAWN:
-            pygame.draw.circle(self.screen, fill, (cx, cy - 8), rect.w//7)
-            pygame.draw.circle(self.screen, outline, (cx, cy - 8), rect.w//7, 2)
-        else:
-            pygame.draw.circle(self.screen, fill, (cx, cy - 6), rect.w//6)
-            pygame.draw.circle(self.screen, outline, (cx, cy - 6), rect.w//6, 2)
+            over.append((self.select_border, self._xy(self.selected)))
+            off = SQ_SIZE//2 - self.legal_dot_radius
+            for mv in self._legal_from_selected():
+                dx, dy = self._xy(mv.to_square)
+                over.append((self.legal_dot, (dx + off, dy + off)))
+            blit_many(self.screen, over)
+        # pieces: one batched blit call instead of one blit per piece
+        sq2xy = self._sq2xy[self.orientation_white_bottom]
+        seq = [(self.pieces[p.symbol()], sq2xy[sq]) for sq, p in self.board.piece_map().items()]
+        blit_many(self.screen, seq, PIECE_BLEND)
 
     def draw_panel(self):
-        panel_x = self.panel_x
-        pygame.draw.rect(self.screen, PANEL_BG, pygame.Rect(panel_x, 0, PANEL_WIDTH, BOARD_SIZE))
-        # title
-        title = self.font_big.render("Menu", True, TEXT_COLOR)
-        self.screen.blit(title, self.title_pos)
-        # slider and +/- buttons
+        self.screen.blit(self.panel_static, (self.panel_x, 0))
+        # slider
         self.slider.draw(self.screen)
-        self.btn_minus.draw(self.screen); self.btn_plus.draw(self.screen)
-        # progress bar
-        pygame.draw.rect(self.screen, BOX_BG, self.progress_rect, border_radius=6)
+        # progress bar (track is part of panel_static)
         if self.engine_thinking and self.engine_start:
             elapsed = time.time() - self.engine_start
             denom = max(0.0001, self.movetime)
@@ -566,30 +822,41 @@ class ChessApp:
             info_txt = f"Thinking {elapsed:.2f}s / {self.movetime:.1f}s"
         else:
             info_txt = f"Last think: {self.last_think_duration:.2f}s"
-        info = self.font_small.render(info_txt, True, TEXT_COLOR)
+        info = render_text(self.font_small, info_txt, TEXT_COLOR)
         self.screen.blit(info, (self.progress_rect.x + 4, self.progress_rect.y + self.progress_rect.h + self.think_text_offset))
 
-        # draw stacked buttons
-        for b in [self.btn_suggest_white, self.btn_suggest_black, self.btn_apply, self.btn_undo, self.btn_redo, self.btn_toggle_persp]:
-            b.draw(self.screen)
-
-        # footer (small centered line at bottom of panel)
-        footer_pad = 12
-        footer_y = BOARD_SIZE - footer_pad - 18
-        footer_surf = self.font_footer.render(FOOTER_TEXT, True, NOTE_COLOR)
-        fx = panel_x + (PANEL_WIDTH - footer_surf.get_width()) // 2
-        self.screen.blit(footer_surf, (fx, footer_y))
+        # only hovered buttons differ from the cached chrome
+        for b in self.buttons:
+            if b.hover:
+                b.draw(self.screen)
 
     # main loop
     def run(self):
         while self.running:
-            self.clock.tick(FPS)
-            mx, my = pygame.mouse.get_pos()
-            for b in self.buttons:
-                b.hover = b.rect.collidepoint((mx, my))
-            for ev in pygame.event.get():
+            animating = self.engine_thinking or self.suggestion_from_to or self.notification is not None
+            if animating:
+                self.clock.tick(FPS)
+                events = pygame.event.get()
+            else:
+                # idle: block in SDL until input arrives instead of spinning at FPS
+                ev = pygame.event.wait(IDLE_WAIT_MS)
+                events = [] if ev.type == pygame.NOEVENT else [ev] + pygame.event.get()
+                self.clock.tick()
+            for ev in coalesce_motion(events):
                 if ev.type == pygame.QUIT:
                     self.running = False; break
+                if ev.type == pygame.MOUSEMOTION:
+                    # hover only changes when the mouse moves
+                    for b in self.buttons:
+                        hover = b.rect.collidepoint(ev.pos)
+                        if hover != b.hover:
+                            b.hover = hover
+                            self.mark_dirty(b.rect)
+                    if self.slider.dragging:
+                        self.mark_dirty(self.slider.bounds())
+                else:
+                    # clicks and keys can change anything on screen
+                    self.mark_dirty()
                 if ev.type == pygame.KEYDOWN:
                     mods = pygame.key.get_mods()
                     if ev.key == pygame.K_z:
@@ -629,11 +896,28 @@ class ChessApp:
             if self.notification and time.time() > self.notification[2]:
                 self.notification = None
 
+            # finished engine jobs (mark the whole window dirty)
+            self._poll_engine_results()
+
+            # animated regions
+            if self.engine_thinking:
+                self.mark_dirty(self.progress_area)
+            if self.suggestion_from_to:
+                self.mark_dirty(pygame.Rect(self._xy(self.suggestion_from_to[0]), (SQ_SIZE, SQ_SIZE)))
+
+            if not self.full_redraw and not self.dirty:
+                continue
+
             # draw
             self.screen.fill((10,10,10))
             self.draw_board()
             self.draw_panel()
-            pygame.display.flip()
+            if self.full_redraw:
+                pygame.display.flip()
+            elif self.dirty:
+                pygame.display.update(self.dirty)
+            self.dirty.clear()
+            self.full_redraw = False
 
         # cleanup engine
         try: